@@ -6,8 +6,23 @@ __all__ = [
     "StdOutReplacerMixin", "StdErrReplacerMixin", "StdOutStreamRedirector", "StdErrStreamRedirector", "StdOutFileRedirector", "Supressor",
 ]
 
+from typing import Any, TYPE_CHECKING
+
 from .functions import is_running_in_ipython, executed_within_user_tree, issubclass_safe, is_non_string_iterable, class_name, stringify_exception, lambda_source, file_stem_of_class
-from .classes import Version, Counter, OneOrMany, Base64, Gender, Timer, Profiler, NullContext
+from .classes import Version, Counter, OneOrMany, Base64, Gender, Timer, NullContext
 from .mixin import ReprMixin, CopyMixin, ParametrizableMixin
 from .meta import PostInitMeta
 from .std_stream_replacer import StdOutReplacerMixin, StdErrReplacerMixin, StdOutStreamRedirector, StdErrStreamRedirector, StdOutFileRedirector, Supressor
+
+if TYPE_CHECKING:
+    from .classes.profiler import Profiler
+
+
+def __getattr__(name: str) -> Any:
+    # names that miscutils.classes resolves lazily are forwarded to it
+    from . import classes
+
+    if name in classes.__all__:
+        return getattr(classes, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,11 +2,25 @@ __all__ = [
     "Base64", "Counter", "Gender", "NullContext", "OneOrMany", "Profiler", "Timer", "Version"
 ]
 
+from typing import Any, TYPE_CHECKING
+
 from .base64 import Base64
 from .counter import Counter
 from .gender import Gender
 from .null_context import NullContext
 from .one_or_many import OneOrMany
-from .profiler import Profiler
 from .timer import Timer
 from .version import Version
+
+if TYPE_CHECKING:
+    from .profiler import Profiler
+
+
+def __getattr__(name: str) -> Any:
+    # Profiler is resolved lazily so that importing this package does not pull in pyinstrument
+    if name == "Profiler":
+        from .profiler import Profiler
+        globals()[name] = Profiler
+        return Profiler
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
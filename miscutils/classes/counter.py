@@ -5,6 +5,7 @@ from math import inf as infinity
 
 class Counter:
     """Counter implementation that can have a limit set and can then be iterated over. Start value can also be set."""
+    __slots__ = ("start", "value", "limit")
 
     def __init__(self, start: int = 0, limit: int = infinity) -> None:
         self.start = self.value = start
@@ -21,11 +22,10 @@ class Counter:
         return self
 
     def __next__(self) -> int:
-        if self.value >= self.limit:
+        if (ret := self.value) >= self.limit:
             raise StopIteration
 
-        ret = self.value
-        self.increment()
+        self.value = ret + 1
         return ret
 
     def increment(self, amount: int = 1) -> Counter:
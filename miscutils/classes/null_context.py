@@ -4,7 +4,16 @@ from typing import Any
 
 
 class NullContext:
-    """Context manager that does nothing. Attributes can be set and accessed and it can be called and it will only ever return itself without doing anything."""
+    """
+    Context manager that does nothing. Attributes can be set and accessed and it can be called and it will only ever return itself without doing anything.
+    Since it is stateless, instantiating it always returns the same instance.
+    """
+
+    def __new__(cls) -> NullContext:
+        if (instance := cls.__dict__.get("_instance")) is None:
+            instance = cls._instance = super().__new__(cls)
+
+        return instance
 
     def __bool__(self) -> bool:
         return False
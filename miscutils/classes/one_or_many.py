@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Optional, Type, Any, Callable, Union
 
-from maybe import Maybe
 from subtypes import Enum
 
 from ..functions import class_name
@@ -50,7 +49,7 @@ class OneOrMany:
                         if isinstance(coerced, self._dtype):
                             as_list[index] = coerced
                         else:
-                            raise TypeError(f"Attempted to coerce object: {repr(item)} of type '{class_name(item)}' to type(s) {repr(self._dtype_name)} using '{Maybe(self._coerce_callback).else_(self._dtype)}' as a callback, but returned {repr(coerced)} of type '{class_name(coerced)}'.")
+                            raise TypeError(f"Attempted to coerce object: {repr(item)} of type '{class_name(item)}' to type(s) {repr(self._dtype_name)} using '{self._coerce_callback if self._coerce_callback is not None else self._dtype}' as a callback, but returned {repr(coerced)} of type '{class_name(coerced)}'.")
                     elif self._on_type_mismatch == self.IfTypeNotMatches.IGNORE:
                         continue
                     else:
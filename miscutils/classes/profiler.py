@@ -4,7 +4,10 @@ import pyinstrument
 
 
 class Profiler(pyinstrument.Profiler):
-    """A subclass of pyinstrument.Profiler with a better __str__ method."""
+    """A subclass of pyinstrument.Profiler with a better __str__ method and coarser, lower-overhead sampling defaults."""
+
+    def __init__(self, interval: float = 0.01, async_mode: str = "disabled", use_timing_thread: bool = True) -> None:
+        super().__init__(interval=interval, async_mode=async_mode, use_timing_thread=use_timing_thread)
 
     def __str__(self) -> str:
         return self.output_text(unicode=True, color=True)
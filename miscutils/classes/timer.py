@@ -1,21 +1,23 @@
 from __future__ import annotations
 
-from functools import total_ordering
+from numbers import Real
 from typing import Optional, Any
-import time
+from time import perf_counter_ns, sleep
 
 
-@total_ordering
 class Timer:
     """
     A timer that begins on instanciation and can be converted to a string, int, or float. It can be reset by calling it.
-    When used as a context manager, upon exiting sets a Timer.period attribute indicating the timer's value at point of exit. Entering does not reset the timer.
+    Uses the monotonic nanosecond performance counter, so Timer.start and Timer.end are counter readings rather than epoch timestamps.
+    When used as a context manager, upon exiting sets a Timer.end attribute with the time of exit and a Timer.period attribute indicating the timer's value at that point.
+    Entering does not reset the timer.
     """
 
     def __init__(self, timeout: float = None, retry_delay: float = None) -> None:
         self.period: Optional[float] = None
+        self.end: Optional[int] = None
         self.timeout, self.retry_delay = timeout, retry_delay
-        self.start = time.time()
+        self.start = perf_counter_ns()
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(seconds={float(self)})"
@@ -24,45 +26,83 @@ class Timer:
         return str(float(self))
 
     def __bool__(self) -> bool:
-        return self.timeout is None or self < self.timeout
+        return self._timeout_ns is None or perf_counter_ns() - self.start < self._timeout_ns
 
     def __iter__(self) -> Timer:
         self._fresh = True
+        self._deadline_ns = None if self._timeout_ns is None else self._timeout_ns - int((self.retry_delay or 0) * 1_000_000_000)
         return self
 
     def __next__(self) -> float:
-        if self.timeout is None:
+        if self._deadline_ns is None:
             raise RuntimeError(f"Cannot iterate over a {type(self).__name__} that does not have a timeout set.")
 
-        if float(self) + (self.retry_delay or 0) > self.timeout:
+        if (elapsed := perf_counter_ns() - self.start) > self._deadline_ns:
             raise StopIteration
 
         if self._fresh:
             self._fresh = False
         elif self.retry_delay is not None:
-            time.sleep(self.retry_delay)
+            sleep(self.retry_delay)
+            elapsed = perf_counter_ns() - self.start
 
-        return float(self)
+        return elapsed * 1e-9
 
     def __int__(self) -> int:
-        return int(float(self))
+        return (perf_counter_ns() - self.start) // 1_000_000_000
 
     def __float__(self) -> float:
-        return time.time() - self.start
+        return (perf_counter_ns() - self.start) * 1e-9
 
     def __call__(self) -> Timer:
-        self.start = time.time()
+        self.start = perf_counter_ns()
         return self
 
     def __enter__(self) -> Timer:
-        self.period = None
         return self
 
     def __exit__(self, ex_type: Any, value: Any, trace: Any) -> None:
-        self.period = float(self)
+        self.end = perf_counter_ns()
+        self.period = (self.end - self.start) * 1e-9
 
     def __eq__(self, other: Any) -> bool:
-        return int(self) == other
+        return (perf_counter_ns() - self.start) // 1_000_000_000 == other
 
     def __lt__(self, other: Any) -> bool:
-        return float(self) < other
+        # timers compare by elapsed time, so the one that started later is the lesser
+        if isinstance(other, Timer):
+            return self.start > other.start
+        if isinstance(other, Real):
+            return perf_counter_ns() - self.start < other * 1_000_000_000
+        return (perf_counter_ns() - self.start) * 1e-9 < other
+
+    def __le__(self, other: Any) -> bool:
+        if isinstance(other, Timer):
+            return self.start >= other.start
+        if isinstance(other, Real):
+            return perf_counter_ns() - self.start <= other * 1_000_000_000
+        return (perf_counter_ns() - self.start) * 1e-9 <= other
+
+    def __gt__(self, other: Any) -> bool:
+        if isinstance(other, Timer):
+            return self.start < other.start
+        if isinstance(other, Real):
+            return perf_counter_ns() - self.start > other * 1_000_000_000
+        return (perf_counter_ns() - self.start) * 1e-9 > other
+
+    def __ge__(self, other: Any) -> bool:
+        if isinstance(other, Timer):
+            return self.start <= other.start
+        if isinstance(other, Real):
+            return perf_counter_ns() - self.start >= other * 1_000_000_000
+        return (perf_counter_ns() - self.start) * 1e-9 >= other
+
+    @property
+    def timeout(self) -> Optional[float]:
+        """The number of seconds after which this timer will evaluate falsy and stop iterating."""
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, val: Optional[float]) -> None:
+        self._timeout = val
+        self._timeout_ns = None if val is None else int(val * 1_000_000_000)
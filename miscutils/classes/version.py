@@ -10,58 +10,57 @@ from subtypes import Enum
 @total_ordering
 class Version:
     """Version class with comparison operators, string conversion using a customizable wildcard, and attribute control."""
+    __slots__ = ("_key", "wildcard")
+
     class Update(Enum):
         MAJOR = MINOR = MICRO = Enum.Auto()
 
     inf = cast(int, infinity)
 
     def __init__(self, major: int, minor: int, micro: int, wildcard: str = None) -> None:
+        self._key = (self.inf, self.inf, self.inf)
         self.major, self.minor, self.micro, self.wildcard = major, minor, micro, wildcard
 
     def __repr__(self) -> str:
-        major = self.wildcard if (val := self.major) is None else val
-        minor = self.wildcard if (val := self.minor) is None else val
-        micro = self.wildcard if (val := self.micro) is None else val
-        return f"{type(self).__name__}(major={repr(major)}, minor={repr(minor)}, micro={repr(micro)})"
+        (major, minor, micro), inf, wildcard = self._key, self.inf, self.wildcard
+        return f"{type(self).__name__}(major={repr(wildcard if major == inf else major)}, minor={repr(wildcard if minor == inf else minor)}, micro={repr(wildcard if micro == inf else micro)})"
 
     def __str__(self) -> str:
-        major = self.wildcard if (val := self.major) is None else val
-        minor = self.wildcard if (val := self.minor) is None else val
-        micro = self.wildcard if (val := self.micro) is None else val
-        return f"{major}.{minor}.{micro}"
+        (major, minor, micro), inf, wildcard = self._key, self.inf, self.wildcard
+        return f"{wildcard if major == inf else major}.{wildcard if minor == inf else minor}.{wildcard if micro == inf else micro}"
 
     def __eq__(self, other: Version) -> bool:
-        return (self._major, self._minor, self._micro) == (other._major, other._minor, other._micro)
+        return self._key == other._key
 
     def __lt__(self, other: Version) -> bool:
-        return (self._major, self._minor, self._micro) < (other._major, other._minor, other._micro)
+        return self._key < other._key
 
     @property
     def major(self) -> Optional[int]:
         """The major version number."""
-        return None if self._major == self.inf else self._major
+        return None if (val := self._key[0]) == self.inf else val
 
     @major.setter
     def major(self, val: Optional[int]) -> None:
-        self._major = self.inf if val is None else val
+        self._key = (self.inf if val is None else val, self._key[1], self._key[2])
 
     @property
     def minor(self) -> Optional[int]:
         """The minor version number."""
-        return None if self._minor == self.inf else self._minor
+        return None if (val := self._key[1]) == self.inf else val
 
     @minor.setter
     def minor(self, val: Optional[int]) -> None:
-        self._minor = self.inf if val is None else val
+        self._key = (self._key[0], self.inf if val is None else val, self._key[2])
 
     @property
     def micro(self) -> Optional[int]:
         """The micro version number."""
-        return None if self._micro == self.inf else self._micro
+        return None if (val := self._key[2]) == self.inf else val
 
     @micro.setter
     def micro(self, val: Optional[int]) -> None:
-        self._micro = self.inf if val is None else val
+        self._key = (self._key[0], self._key[1], self.inf if val is None else val)
 
     def increment_major(self, magnitude: int = 1) -> Version:
         self.major += magnitude
@@ -1,34 +1,37 @@
 from __future__ import annotations
 
-import ast
-import inspect
+import builtins
 import os
 import sys
 import traceback
+from functools import cache
 from typing import Optional, Any, Callable, Type
 from collections.abc import Iterable
 from pathlib import Path
-
-from pathmagic import Dir
+from types import CodeType
 
 
+@cache
 def is_running_in_ipython() -> bool:
-    """Returns True if run from within a jupyter ipython interactive session, else False."""
-    try:
-        assert __IPYTHON__
-        return True
-    except (NameError, AttributeError):
-        return False
+    """Returns True if run from within a jupyter ipython interactive session, else False. The result is computed once and then cached."""
+    return bool(getattr(builtins, "__IPYTHON__", False))
 
 
+@cache
 def executed_within_user_tree() -> bool:
-    """Returns True if the '__main__' module is within the branches of the current user's filesystem tree, else False."""
+    """Returns True if the '__main__' module is within the branches of the current user's filesystem tree, else False. The result is computed once and then cached."""
+    from pathmagic import Dir
+
     main_dir = sys.modules["__main__"]._dh[0] if is_running_in_ipython() else sys.modules["__main__"].__file__
     return Dir.from_home() > os.path.abspath(main_dir)
 
 
 def file_stem_of_class(cls: Type) -> str:
-    return Path(inspect.getfile(cls)).stem
+    if (file := getattr(sys.modules.get(cls.__module__), "__file__", None)) is None:
+        import inspect
+        file = inspect.getfile(cls)
+
+    return Path(file).stem
 
 
 def issubclass_safe(candidate: Any, ancestor: Any) -> bool:
@@ -44,16 +47,19 @@ def is_non_string_iterable(candidate: Any) -> bool:
 
 
 def class_name(candidate: Any) -> str:
-    cls = candidate if isinstance(candidate, type) or issubclass_safe(candidate, type) else type(candidate)
+    cls = candidate if isinstance(candidate, type) else type(candidate)
     return cls.__name__
 
 
 def stringify_exception(ex: Exception) -> str:
-    return "".join(traceback.format_exception(etype=type(ex), value=ex, tb=ex.__traceback__))
+    return "".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
 
 
 def lambda_source(lambda_func: Callable) -> Optional[str]:
     """Return the source of a (short) lambda function. If it's impossible to obtain, return None."""
+    import ast
+    import inspect
+
     try:
         source_lines, _ = inspect.getsourcelines(lambda_func)
     except (IOError, TypeError):
@@ -62,26 +68,28 @@ def lambda_source(lambda_func: Callable) -> Optional[str]:
     if len(source_lines) != 1:
         return None
 
-    source_text = os.linesep.join(source_lines).strip()
+    source_text = source_lines[0].strip()
 
-    source_ast = ast.parse(source_text)
-    lambda_node = next((node for node in ast.walk(source_ast) if isinstance(node, ast.Lambda)), None)
-    if lambda_node is None:
+    try:
+        source_ast = ast.parse(source_text)
+    except SyntaxError:
         return None
 
-    lambda_text = source_text[lambda_node.col_offset:]
-    lambda_body_text = source_text[lambda_node.body.col_offset:]
-    min_length = len('lambda:_')
-    while len(lambda_text) > min_length:
-        try:
-            code = compile(lambda_body_text, '<unused filename>', 'eval')
+    lambda_nodes = [node for node in ast.walk(source_ast) if isinstance(node, ast.Lambda)]
+    if len(lambda_nodes) == 1:
+        return ast.get_source_segment(source_text, lambda_nodes[0])
+
+    target = lambda_func.__code__
+    for lambda_node in lambda_nodes:
+        segment = ast.get_source_segment(source_text, lambda_node)
 
-            # noinspection PyUnresolvedReferences
-            if len(code.co_code) == len(lambda_func.__code__.co_code):
-                return lambda_text
+        try:
+            code = compile(segment, '<unused filename>', 'eval')
         except SyntaxError:
-            pass
-        lambda_text = lambda_text[:-1]
-        lambda_body_text = lambda_body_text[:-1]
+            continue
+
+        lambda_code = next(const for const in code.co_consts if isinstance(const, CodeType))
+        if lambda_code.co_code == target.co_code and lambda_code.co_varnames == target.co_varnames:
+            return segment
 
     return None
@@ -1,21 +1,27 @@
-from typing import Any, Callable
+from typing import Callable
 from wrapt import decorator
 
 
 class PostInitMeta(type):
-    _post_init_registry: dict[Any, int] = {}
+    _post_init_registry: dict[int, int] = {}
 
     def post_init_soon(cls) -> Callable:
         @decorator
         def wrapper(func, instance, args, kwargs):
-            cls._post_init_registry[instance] = cls._post_init_registry.get(instance, 0) + 1
+            # keyed by id() so that neither the instance's own __hash__/__eq__ nor its attribute access (which may be slotted or overridden) is involved
+            key = id(instance)
+            registry = cls._post_init_registry
+            registry[key] = registry.get(key, 0) + 1
 
-            ret = func(*args, **kwargs)
+            try:
+                ret = func(*args, **kwargs)
+            finally:
+                if depth := registry[key] - 1:
+                    registry[key] = depth
+                else:
+                    del registry[key]
 
-            if ref := (cls._post_init_registry[instance] - 1):
-                cls._post_init_registry[instance] = ref
-            else:
-                del cls._post_init_registry[instance]
+            if not depth:
                 instance.__post_init__()
 
             return ret
@@ -1,27 +1,37 @@
 from __future__ import annotations
 
 from copy import copy, deepcopy
-from typing import Any, Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
 
 
 T = TypeVar("T")
 
 
 class ReprMixin:
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}({', '.join([f'{attr}={repr(val)}' for attr, val in self.__dict__.items() if not attr.startswith('_')])})"
 
 
 class CopyMixin:
+    __slots__ = ()
+    _deepcopy_atomic: ClassVar[bool] = False
+
     def copy(self) -> CopyMixin:
         return copy(self)
 
     def deepcopy(self) -> CopyMixin:
-        return deepcopy(self)
+        """Return a deep copy of this object. Subclasses whose attributes only ever hold immutable values can set '_deepcopy_atomic' to True to make this a (much cheaper) shallow copy."""
+        return copy(self) if self._deepcopy_atomic else deepcopy(self)
 
 
 class ParametrizableMixin:
+    __slots__ = ()
+
     class ParametrizedProxy(Generic[T]):
+        __slots__ = ("cls", "param")
+
         def __init__(self, cls: T, param: Any) -> None:
             self.cls, self.param = cls, param
 
@@ -4,26 +4,60 @@ import io
 import os
 import sys
 import warnings
-from typing import TextIO, Any
+from functools import cache
+from typing import TextIO, Any, Callable, TYPE_CHECKING
 
-from pathmagic import Dir, PathLike
+if TYPE_CHECKING:
+    from pathmagic import PathLike
+
+
+@cache
+def _devnull() -> TextIO:
+    return open(os.devnull, mode="w", encoding="utf-8", errors="ignore")
+
+
+class _DevNullStream:
+    """Non-data descriptor that lazily opens a single shared handle to os.devnull the first time it is accessed. Values assigned on the instance take precedence."""
+
+    def __get__(self, instance: Any, owner: type) -> TextIO:
+        return _devnull()
+
+
+def _passthrough(attr: str) -> Callable:
+    """Mark a method as merely forwarding to the method of the same name on the stream held in the given attribute."""
+    def decorator(func: Callable) -> Callable:
+        func._passthrough_to = attr
+        return func
+    return decorator
 
 
 class BaseReplacerMixin:
-    stream: TextIO = open(os.devnull, mode="w", encoding="utf-8", errors="ignore")
+    stream: TextIO = _DevNullStream()
+    _passthroughs: tuple[tuple[str, str], ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # while in scope, methods that merely forward to another stream are shadowed by that stream's own bound methods to skip a Python-level call
+        cls._passthroughs = tuple((name, attr) for name in ("write", "flush", "close") if (attr := getattr(getattr(cls, name), "_passthrough_to", None)) is not None)
 
     def __enter__(self) -> BaseReplacerMixin:
-        if self.target is not self:
-            self.stream = self.target
+        if (target := self.target) is not self:
+            self.stream = target
             self.target = self
 
+            for name, attr in self._passthroughs:
+                setattr(self, name, getattr(getattr(self, attr), name))
+
         return self
 
     def __exit__(self, ex_type: Any, ex_value: Any, ex_traceback: Any) -> None:
-        if self.stream is not type(self).stream:
+        if "stream" in vars(self):
             self.target = self.stream
             del self.stream
 
+            for name, _ in self._passthroughs:
+                delattr(self, name)
+
     @property
     def target(self):
         raise NotImplementedError
@@ -32,12 +66,15 @@ class BaseReplacerMixin:
     def target(self):
         raise NotImplementedError
 
+    @_passthrough("stream")
     def write(self, text: str) -> None:
         self.stream.write(text)
 
+    @_passthrough("stream")
     def flush(self) -> None:
         self.stream.flush()
 
+    @_passthrough("stream")
     def close(self) -> None:
         self.stream.close()
 
@@ -65,9 +102,11 @@ class StdErrReplacerMixin(BaseReplacerMixin):
 class StdOutFileRedirector(StdOutReplacerMixin):
     """Context manager that redirects sys.stdout to the given file while in scope. Optionally opens the file on exiting."""
 
-    def __init__(self, file: PathLike = None, append: bool = False, openfile: bool = True) -> None:
-        self.file = Dir.from_pathlike(file) if file is not None else Dir.from_desktop().new_file("print_redirection", "txt")
-        self.append, self.openfile = append, openfile
+    def __init__(self, file: PathLike = None, append: bool = False, openfile: bool = True, buffer_size: int = 65536) -> None:
+        from pathmagic import Dir, File
+
+        self.file = File.from_pathlike(file) if file is not None else Dir.from_desktop().new_file("print_redirection", "txt")
+        self.append, self.openfile, self.buffer_size = append, openfile, buffer_size
 
         if not append:
             self.file.content = None
@@ -76,17 +115,23 @@ class StdOutFileRedirector(StdOutReplacerMixin):
         return self.file.content
 
     def __enter__(self) -> StdOutFileRedirector:
+        if self.target is not self:
+            self.out = open(self.file, "a" if self.append else "w", buffering=self.buffer_size, encoding="utf-8")
+
         super().__enter__()
-        self.out = open(self.file, "a" if self.append else "w")
         return self
 
     def __exit__(self, ex_type: Any, ex_value: Any, ex_traceback: Any) -> None:
+        in_scope = "stream" in vars(self)
         super().__exit__(ex_type=ex_type, ex_value=ex_value, ex_traceback=ex_traceback)
-        self.out.close()
 
-        if self.openfile:
-            self.file.start()
+        if in_scope:
+            self.out.close()
+
+            if self.openfile:
+                self.file.start()
 
+    @_passthrough("out")
     def write(self, text: str) -> None:
         self.out.write(text)
 
@@ -100,15 +145,15 @@ class BaseStreamRedirector(BaseReplacerMixin):
     def __str__(self) -> str:
         return self.out.getvalue()
 
-    def __exit__(self, ex_type: Any, ex_value: Any, ex_traceback: Any) -> None:
-        super().__exit__(ex_type, ex_value, ex_traceback)
-
+    @_passthrough("out")
     def write(self, text: str) -> None:
         self.out.write(text)
 
+    @_passthrough("out")
     def flush(self) -> None:
         self.out.flush()
 
+    @_passthrough("out")
     def close(self) -> None:
         self.out.close()
 
@@ -124,19 +169,25 @@ class StdErrStreamRedirector(BaseStreamRedirector, StdErrReplacerMixin):
 class Supressor(StdOutReplacerMixin):
     """Context manager that suppresses all output to sys.stdout and all warnings while in scope."""
 
-    def __init__(self):
-        super().__init__()
-        self.catch_warnings = warnings.catch_warnings()
-
     def __enter__(self) -> Supressor:
         super().__enter__()
-        self.catch_warnings.__enter__()
-        warnings.filterwarnings("ignore")
+
+        if "catch_warnings" not in vars(self):
+            self.catch_warnings = warnings.catch_warnings()
+            self.catch_warnings.__enter__()
+            warnings.simplefilter("ignore")
+
         return self
 
     def __exit__(self, ex_type: Any, ex_value: Any, ex_traceback: Any) -> None:
         super().__exit__(ex_type=ex_type, ex_value=ex_value, ex_traceback=ex_traceback)
-        self.catch_warnings.__exit__(ex_type, ex_value, ex_traceback)
 
-    def write(self, text: str) -> None:
+        if "catch_warnings" in vars(self):
+            self.catch_warnings.__exit__(ex_type, ex_value, ex_traceback)
+            del self.catch_warnings
+
+    # discards the text without entering a Python frame, returning the number of characters 'written' as TextIO.write does
+    write = staticmethod(len)
+
+    def flush(self) -> None:
         pass
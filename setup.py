@@ -9,7 +9,7 @@ with open(path.join(here, "README.md"), encoding="utf-8") as f:
     long_description = f.read()
 
 with open(path.join(here, "requirements.txt"), encoding="utf-8") as f:
-    dependencies = [line for line in f if line]
+    dependencies = [line for raw_line in f.read().splitlines() if (line := raw_line.strip()) and not line.startswith("#")]
 
 setup(
     name="pymiscutils",
@@ -1,4 +1,9 @@
-# import pytest
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from miscutils.classes import Timer
 
 
 class TestTimer:
@@ -27,7 +32,57 @@ class TestTimer:
         assert True
 
     def test___lt__(self):  # synced
-        assert True
+        earlier, later = Timer(), Timer()
+        later.start = earlier.start + 1
+        assert later < earlier and not earlier < later
+
+        timer = Timer()
+        timer.start -= 2_000_000_000
+        assert timer < 60 and timer < Fraction(5, 2) and timer < Decimal("2.5") and not timer < 1
+
+    def test___le__(self):  # synced
+        earlier, later = Timer(), Timer()
+        later.start = earlier.start
+        assert later <= earlier and earlier <= later
+
+        timer = Timer()
+        timer.start -= 2_000_000_000
+        assert timer <= 60 and timer <= Fraction(5, 2) and timer <= Decimal("2.5") and not timer <= 1
+
+    def test___gt__(self):  # synced
+        earlier, later = Timer(), Timer()
+        later.start = earlier.start + 1
+        assert earlier > later and not later > earlier
+
+        timer = Timer()
+        timer.start -= 2_000_000_000
+        assert timer > 1 and timer > Fraction(3, 2) and timer > Decimal("1.5") and not timer > 60
+
+    def test___ge__(self):  # synced
+        earlier, later = Timer(), Timer()
+        later.start = earlier.start
+        assert earlier >= later and later >= earlier
+
+        timer = Timer()
+        timer.start -= 2_000_000_000
+        assert timer >= 1 and timer >= Fraction(3, 2) and timer >= Decimal("1.5") and not timer >= 60
+
+    def test_unorderable(self):
+        class Reflected:
+            def __gt__(self, other):
+                return "reflected"
+
+        assert (Timer() < Reflected()) == "reflected"
+
+        with pytest.raises(TypeError):
+            Timer() < "1"
+
+    def test_timeout(self):  # synced
+        timer = Timer(timeout=1.5)
+        assert timer.timeout == 1.5 and timer._timeout_ns == 1_500_000_000
+
+        timer.timeout = None
+        assert timer.timeout is None and timer._timeout_ns is None
 
 
 class TestVersion:
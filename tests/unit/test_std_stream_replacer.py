@@ -58,3 +58,6 @@ class TestStdErrStreamRedirector:
 class TestSupressor:
     def test_write(self):  # synced
         assert True
+
+    def test_flush(self):  # synced
+        assert True